@@ -8,41 +8,50 @@ A script to generate comparison blog posts between two crypto assets.
 import os
 import sys
 import argparse
+import asyncio
+import csv
+import itertools
+import json
 import logging
-from typing import Tuple
+from datetime import datetime
+from typing import Any, Dict, Optional, TextIO, Tuple
 from pathlib import Path
 
-# Try to load environment variables from .env file
-try:
-    from dotenv import load_dotenv
-    # Load from .env file in the project root
-    dotenv_path = Path(__file__).parent / '.env'
-    if dotenv_path.exists():
-        load_dotenv(dotenv_path=dotenv_path)
-        print(f"Loaded environment variables from {dotenv_path}")
-    else:
-        load_dotenv()  # Try default locations
-        print("Loaded environment variables from default location")
-except ImportError:
-    print("python-dotenv package not found. Environment variables must be set manually.")
-
 # Add the current directory to the path so we can import our module
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
 try:
     from src.comparison_blog_writer import ComparisonBlogWriter
+    from src.env import ensure_env_loaded
 except ImportError:
     print("Error: Could not import ComparisonBlogWriter. Make sure the src directory is set up correctly.")
     sys.exit(1)
 
-def configure_logging():
-    """Set up logging configuration for the script."""
+def configure_logging(log_to_file: bool = True):
+    """
+    Set up logging configuration for the script.
+    
+    Args:
+        log_to_file: Whether to also write the log to a timestamped file in logs/
+    """
+    # Logging is already configured (e.g. main() called again in the same
+    # process); basicConfig would ignore the new handlers, so don't open a log file
+    if logging.getLogger().handlers:
+        return
+    
+    handlers = [logging.StreamHandler()]
+    
+    if log_to_file:
+        # Make sure the log directory exists before the file handler opens its file
+        logs_path = Path('logs')
+        logs_path.mkdir(parents=True, exist_ok=True)
+        log_file = logs_path / f'blog_generator_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+        handlers.append(logging.FileHandler(log_file, encoding='utf-8'))
+        
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler()
-        ]
+        handlers=handlers
     )
 
 def parse_arguments() -> argparse.Namespace:
@@ -95,6 +104,28 @@ def parse_arguments() -> argparse.Namespace:
         default=5
     )
     
+    parser.add_argument(
+        "--concurrency",
+        help="Maximum number of blog posts generated at the same time in batch mode "
+             "(defaults to $OPENAI_CONCURRENCY or 8)",
+        type=int,
+        default=None
+    )
+    
+    parser.add_argument(
+        "--group-size",
+        help="Number of blog posts requested together in one OpenAI call in batch mode (at most 8)",
+        type=int,
+        default=1
+    )
+    
+    parser.add_argument(
+        "--batch-api",
+        help="In batch mode, submit the pairs through the OpenAI Batch API (about half the cost, "
+             "but results can take up to 24 hours)",
+        action="store_true"
+    )
+    
     # Add argument to list available pairs
     group.add_argument(
         "--list-pairs",
@@ -109,21 +140,39 @@ def parse_arguments() -> argparse.Namespace:
         default=10
     )
     
+    parser.add_argument(
+        "--pretty",
+        help="Indent the saved blog JSON for easier reading",
+        action="store_true"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        help="Regenerate blog posts even if a cached version exists",
+        action="store_true"
+    )
+    
+    parser.add_argument(
+        "--jsonl",
+        help="Also append every generated blog post as one JSON line to this file",
+        type=str
+    )
+    
     return parser.parse_args()
 
-def get_asset_terms(args: argparse.Namespace) -> Tuple[str, str]:
+def get_asset_terms(args: argparse.Namespace, blog_writer: ComparisonBlogWriter) -> Tuple[str, str]:
     """
     Get the asset terms to compare.
     
     Args:
         args: Command line arguments
+        blog_writer: The blog writer used to select a random pair
         
     Returns:
         A tuple containing (term_a, term_b)
     """
     if args.random:
         # Select a random asset pair
-        blog_writer = ComparisonBlogWriter()
         return blog_writer.get_random_asset_pair()
     
     if args.term_a and args.term_b:
@@ -134,114 +183,117 @@ def get_asset_terms(args: argparse.Namespace) -> Tuple[str, str]:
     print("Error: Please specify two asset terms (--term-a and --term-b) or use --random.")
     sys.exit(1)
 
-def generate_blog(term_a: str, term_b: str) -> None:
+def generate_blog(blog_writer: ComparisonBlogWriter, term_a: str, term_b: str,
+                  jsonl_sink: Optional[TextIO] = None) -> None:
     """
     Generate a comparison blog post.
     
     Args:
+        blog_writer: The blog writer used to generate the post
         term_a: The first asset term
         term_b: The second asset term
+        jsonl_sink: An open file the blog post is also appended to as a JSON line
     """
     try:
-        # Initialize the blog writer
-        blog_writer = ComparisonBlogWriter()
-        
         # Generate the blog post
         blog_data = blog_writer.process_blog_generation(term_a, term_b)
         
-        print("\nBlog post generated successfully!")
-        print(f"Title: {blog_data.get('title', 'No title')}")
+        # Report the post in one write (word count and read time are computed during generation)
+        print(
+            "\nBlog post generated successfully!\n"
+            f"Title: {blog_data.get('title', 'No title')}\n"
+            f"Word count: {blog_data['_word_count']}\n"
+            f"Read time: {blog_data['_read_time_min']} minutes\n"
+            f"Output: {blog_writer.get_output_file(term_a, term_b)}"
+        )
         
-        # Calculate word count
-        word_count = blog_writer._calculate_word_count(blog_data)
-        print(f"Word count: {word_count}")
-        
-        # Extract read time from the read_time field (e.g. "3 min read" -> 3)
-        read_time_str = blog_data.get('read_time', '0 min read')
-        read_time = int(read_time_str.split()[0]) if read_time_str else 0
-        print(f"Read time: {read_time} minutes")
-        
-        slug = blog_data.get('slug', 'blog')
-        print(f"Output: {blog_writer.output_path / f'{slug}.json'}")
+        if jsonl_sink is not None:
+            _write_jsonl_record(jsonl_sink, blog_data)
         
     except Exception as e:
-        logging.error(f"Error generating blog post: {e}")
+        # Log the traceback too, since this ends the run
+        logging.exception(f"Error generating blog post: {e}")
         sys.exit(1)
 
-def generate_blogs_batch(start_line: int, end_line: int) -> None:
+def generate_blogs_batch(blog_writer: ComparisonBlogWriter, start_line: int, end_line: int,
+                         concurrency: Optional[int] = None, group_size: int = 1, batch_api: bool = False,
+                         jsonl_sink: Optional[TextIO] = None) -> None:
     """
     Generate multiple comparison blog posts for a range of asset pairs from the CSV.
     
     Args:
+        blog_writer: The blog writer used to generate every post
         start_line: The starting line number in the CSV (1-based)
         end_line: The ending line number in the CSV (1-based, inclusive)
+        concurrency: Maximum number of blog posts generated at the same time;
+            defaults to the blog writer's configured concurrency
+        group_size: Number of blog posts requested together in one OpenAI call
+        batch_api: Whether to submit the pairs through the OpenAI Batch API instead
+        jsonl_sink: An open file every generated blog post is also appended to as a JSON line
     """
-    # Initialize the blog writer
-    blog_writer = ComparisonBlogWriter()
-    
     # Get the path to the CSV file
-    csv_path = blog_writer.data_path / "crypto_comparison_pairs_cleaned.csv"
+    csv_path = blog_writer.csv_path
     
     try:
         # Read the CSV file and extract the specified lines
-        with open(csv_path, 'r', encoding='utf-8') as csvfile:
-            # Skip header row
-            lines = csvfile.readlines()[1:]  # 0-based index, so we start from index 1 for row 2
+        with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
             
-            # Adjust for 0-based indexing (line 2 in the file is index 1 in the list)
-            start_index = start_line - 2  # Line 2 becomes index 0
-            end_index = end_line - 2      # Inclusive end
+            # Skip header row
+            next(reader, None)
             
-            # Ensure indices are within bounds
-            if start_index < 0:
-                start_index = 0
+            # Ensure the start line is within bounds
+            if start_line < 2:
+                start_line = 2
                 print(f"Warning: Start line adjusted to line 2 (minimum).")
                 
-            if end_index >= len(lines):
-                end_index = len(lines) - 1
-                print(f"Warning: End line adjusted to line {end_index + 2} (maximum).")
+            # Stream only the specified range of rows (line 2 is the first data row)
+            selected_rows = list(itertools.islice(reader, start_line - 2, max(end_line - 1, start_line - 2)))
+            
+            last_line = start_line + len(selected_rows) - 1
+            if last_line < end_line:
+                print(f"Warning: End line adjusted to line {last_line} (maximum).")
+                
+        # Get the asset pair from each row
+        pairs = []
+        for i, row in enumerate(selected_rows):
+            if len(row) >= 2:
+                pairs.append((row[0], row[1]))
+            else:
+                line = ','.join(row)
+                logging.warning(f"Invalid line format at line {start_line + i}: {line}")
+                print(f"⚠️ Skipping invalid line: {line}")
                 
-            # Get the specified range of lines
-            selected_lines = lines[start_index:end_index + 1]
+        # Load the research for every asset up front so generation only hits the cache
+        blog_writer.prefetch_research(term for pair in pairs for term in pair)
+        
+        if batch_api:
+            # Submit every pair in one Batch API job and report once it has finished
+            print(f"\nSubmitting {len(pairs)} pairs to the OpenAI Batch API; this can take a while...")
+            results = blog_writer.process_blog_generation_batch_api(pairs)
+            for (term_a, term_b), result in zip(pairs, results):
+                _print_batch_result(blog_writer, term_a, term_b, result)
+                if jsonl_sink is not None and not isinstance(result, BaseException):
+                    _write_jsonl_record(jsonl_sink, result)
+            generated = sum(1 for result in results if not isinstance(result, BaseException))
+            print(f"\nBatch processing complete. Generated {generated} of {len(pairs)} blog posts.")
+            return
             
-            # Process each line
-            for i, line in enumerate(selected_lines):
-                # Parse the line to get the asset pair
-                parts = line.strip().split(',')
-                if len(parts) >= 2:
-                    term_a, term_b = parts[0], parts[1]
-                    
-                    # Generate the blog
-                    print(f"\n[{i+1}/{len(selected_lines)}] Processing: {term_a} vs {term_b}")
-                    try:
-                        # Generate the blog post
-                        blog_data = blog_writer.process_blog_generation(term_a, term_b)
-                        
-                        # Print success info
-                        print(f"✅ Blog generated successfully!")
-                        print(f"   Title: {blog_data.get('title', 'No title')}")
-                        
-                        # Calculate word count
-                        word_count = blog_writer._calculate_word_count(blog_data)
-                        print(f"   Word count: {word_count}")
-                        
-                        # Extract read time
-                        read_time_str = blog_data.get('read_time', '0 min read')
-                        read_time = int(read_time_str.split()[0]) if read_time_str else 0
-                        print(f"   Read time: {read_time} minutes")
-                        
-                        # Output file path
-                        slug = blog_data.get('slug', 'blog')
-                        print(f"   Output: {blog_writer.output_path / f'{slug}.json'}")
-                        
-                    except Exception as e:
-                        logging.error(f"Error generating blog for {term_a} vs {term_b}: {e}")
-                        print(f"❌ Failed to generate blog for {term_a} vs {term_b}: {e}")
-                else:
-                    logging.warning(f"Invalid line format at line {start_index + i + 2}: {line.strip()}")
-                    print(f"⚠️ Skipping invalid line: {line.strip()}")
+        # Generate the blogs concurrently, reporting each pair as it starts and finishes
+        def report_start(index: int, term_a: str, term_b: str) -> None:
+            print(f"\n[{index + 1}/{len(pairs)}] Processing: {term_a} vs {term_b}")
             
-            print(f"\nBatch processing complete. Generated {len(selected_lines)} blog posts.")
+        def report_finish(index: int, term_a: str, term_b: str, result: Any) -> None:
+            _print_batch_result(blog_writer, term_a, term_b, result)
+            if jsonl_sink is not None and not isinstance(result, BaseException):
+                _write_jsonl_record(jsonl_sink, result)
+            
+        results = asyncio.run(blog_writer.agenerate_batch(
+            pairs, concurrency, group_size, on_start=report_start, on_finish=report_finish
+        ))
+        generated = sum(1 for result in results if not isinstance(result, BaseException))
+        
+        print(f"\nBatch processing complete. Generated {generated} of {len(pairs)} blog posts.")
                 
     except FileNotFoundError:
         error_msg = f"CSV file not found: {csv_path}"
@@ -253,40 +305,100 @@ def generate_blogs_batch(start_line: int, end_line: int) -> None:
         print(f"Error: Failed to process CSV file: {e}")
         sys.exit(1)
 
-def list_available_pairs(limit: int = 10) -> None:
+def _print_batch_result(blog_writer: ComparisonBlogWriter, term_a: str, term_b: str, result: Any) -> None:
+    """
+    Print the outcome of one blog post in a batch.
+    
+    Args:
+        blog_writer: The blog writer that generated the post
+        term_a: The first asset term
+        term_b: The second asset term
+        result: The blog data, or the exception raised while generating it
+    """
+    if isinstance(result, BaseException):
+        print(f"❌ Failed to generate blog for {term_a} vs {term_b}: {result}")
+        return
+        
+    # Print success info in one write (word count and read time are computed during generation)
+    print(
+        f"✅ Blog generated successfully: {term_a} vs {term_b}\n"
+        f"   Title: {result.get('title', 'No title')}\n"
+        f"   Word count: {result['_word_count']}\n"
+        f"   Read time: {result['_read_time_min']} minutes\n"
+        f"   Output: {blog_writer.get_output_file(term_a, term_b)}"
+    )
+
+def _write_jsonl_record(jsonl_sink: TextIO, blog_data: Dict[str, Any]) -> None:
+    """
+    Append a blog post to a JSON Lines file.
+    
+    Args:
+        jsonl_sink: The open JSON Lines file
+        blog_data: The blog post data; private keys (prefixed with an underscore)
+            are left out, as in the saved blog post
+    """
+    public_data = {key: value for key, value in blog_data.items() if not key.startswith("_")}
+    jsonl_sink.write(json.dumps(public_data, ensure_ascii=False) + "\n")
+
+def _count_remaining_lines(binary_file, chunk_size: int = 1 << 20) -> int:
+    """
+    Count the lines left in a binary file without decoding them.
+    
+    Args:
+        binary_file: A file opened in binary mode
+        chunk_size: Number of bytes to read at a time
+        
+    Returns:
+        The number of remaining lines, including a final line without a newline
+    """
+    line_count = 0
+    last_byte = b'\n'
+    
+    # Count newlines chunk by chunk instead of iterating over decoded lines
+    while True:
+        chunk = binary_file.read(chunk_size)
+        if not chunk:
+            break
+        line_count += chunk.count(b'\n')
+        last_byte = chunk[-1:]
+        
+    # A final line that is not newline-terminated still counts as a line
+    if last_byte != b'\n':
+        line_count += 1
+        
+    return line_count
+
+def list_available_pairs(blog_writer: ComparisonBlogWriter, limit: int = 10) -> None:
     """
     List available asset pairs from the CSV file.
     
     Args:
+        blog_writer: The blog writer providing the CSV path
         limit: Maximum number of pairs to display
     """
-    # Initialize the blog writer just to get the data path
-    blog_writer = ComparisonBlogWriter()
-    
     # Get the path to the CSV file
-    csv_path = blog_writer.data_path / "crypto_comparison_pairs_cleaned.csv"
+    csv_path = blog_writer.csv_path
     
     try:
-        # Read the CSV file
-        with open(csv_path, 'r', encoding='utf-8') as csvfile:
-            # Read all lines and skip header
-            lines = csvfile.readlines()
-            header = lines[0].strip()
-            pairs = lines[1:]  # Skip header row
+        # Read the CSV file in binary mode so the remaining lines can be counted quickly
+        with open(csv_path, 'rb') as csvfile:
+            # Read the header and only as many pairs as will be displayed
+            header = next(csvfile, b'').decode('utf-8').strip()
+            pairs = [line.decode('utf-8') for line in itertools.islice(csvfile, max(limit, 0))]
             
-            total_pairs = len(pairs)
+            # Count the remaining pairs without keeping them in memory
+            total_pairs = len(pairs) + _count_remaining_lines(csvfile)
             
             print(f"\nFound {total_pairs} asset pairs in the CSV file.")
             print("CSV Header:", header)
             print("\nSample pairs:")
             print("-" * 40)
             
-            # Show limited number of pairs
-            display_limit = min(limit, total_pairs)
-            for i in range(display_limit):
-                line_parts = pairs[i].strip().split(',')
-                if len(line_parts) >= 2:
-                    print(f"Line {i+2}: {line_parts[0]} vs {line_parts[1]}")
+            # Show limited number of pairs, parsing only the sampled lines
+            display_limit = len(pairs)
+            for i, row in enumerate(csv.reader(pairs)):
+                if len(row) >= 2:
+                    print(f"Line {i+2}: {row[0]} vs {row[1]}")
             
             if display_limit < total_pairs:
                 print(f"\n... and {total_pairs - display_limit} more pairs.")
@@ -304,28 +416,49 @@ def list_available_pairs(limit: int = 10) -> None:
 
 def main():
     """Main entry point for the script."""
-    # Configure logging
-    configure_logging()
-    
     # Parse command line arguments
     args = parse_arguments()
     
+    # Configure logging (listing pairs does no generation work worth a log file)
+    configure_logging(log_to_file=not args.list_pairs)
+    
+    # Load environment variables from a .env file (done once per process)
+    env_path = ensure_env_loaded()
+    if env_path is not None:
+        print(f"Loaded environment variables from {env_path}")
+    
+    # Initialize the blog writer once so its OpenAI connection pool is shared
+    try:
+        blog_writer = ComparisonBlogWriter(use_cache=not args.no_cache, pretty_output=args.pretty)
+    except ValueError as e:
+        logging.error(f"Error initializing blog writer: {e}")
+        sys.exit(1)
+        
     # Process based on the provided arguments
     if args.list_pairs:
         # List available asset pairs
-        list_available_pairs(args.limit)
-    elif args.batch:
-        # Generate blogs in batch mode
-        print(f"Generating blogs for pairs from lines {args.start_line} to {args.end_line}")
-        generate_blogs_batch(args.start_line, args.end_line)
-    else:
-        # Get the asset terms to compare
-        term_a, term_b = get_asset_terms(args)
-        
-        print(f"Generating comparison blog post: {term_a} vs {term_b}")
+        list_available_pairs(blog_writer, args.limit)
+        return
         
-        # Generate a single blog post
-        generate_blog(term_a, term_b)
+    # Open the JSON Lines file once, with a large buffer, for every post of the run
+    jsonl_sink = open(args.jsonl, 'a', encoding='utf-8', buffering=1 << 20) if args.jsonl else None
+    try:
+        if args.batch:
+            # Generate blogs in batch mode
+            print(f"Generating blogs for pairs from lines {args.start_line} to {args.end_line}")
+            generate_blogs_batch(blog_writer, args.start_line, args.end_line, args.concurrency, args.group_size,
+                                 args.batch_api, jsonl_sink)
+        else:
+            # Get the asset terms to compare
+            term_a, term_b = get_asset_terms(args, blog_writer)
+            
+            print(f"Generating comparison blog post: {term_a} vs {term_b}")
+            
+            # Generate a single blog post
+            generate_blog(blog_writer, term_a, term_b, jsonl_sink)
+    finally:
+        if jsonl_sink is not None:
+            jsonl_sink.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,73 @@
+import os
+import logging
+import functools
+from pathlib import Path
+from typing import List, Optional
+
+# Try to import python-dotenv; without it variables must be set in the environment
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+logger = logging.getLogger("ComparisonBlogWriter")
+
+# The project root, one level above the src directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+def _candidate_env_files() -> List[Path]:
+    """
+    List the locations searched for a .env file, in order of preference.
+    
+    Returns:
+        The project root, the current directory and the XDG config directory
+    """
+    config_home = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+    return [
+        PROJECT_ROOT / ".env",
+        Path.cwd() / ".env",
+        config_home / "comparison_blog_writer" / ".env",
+    ]
+
+@functools.lru_cache(maxsize=None)
+def ensure_env_loaded() -> Optional[Path]:
+    """
+    Load environment variables from the first .env file found.
+    
+    The search runs at most once per process, so it is safe to call this from
+    every entry point. Variables already set in the environment take precedence.
+    
+    Returns:
+        The path of the loaded .env file, or None if no file was loaded
+    """
+    if load_dotenv is None:
+        logger.warning("python-dotenv package not found. Environment variables must be set manually.")
+        return None
+    
+    for env_path in _candidate_env_files():
+        if env_path.is_file():
+            load_dotenv(dotenv_path=env_path)
+            return env_path
+    
+    return None
+
+def get_int_env(name: str, default: Optional[int] = None) -> Optional[int]:
+    """
+    Read an integer setting from the environment.
+    
+    Args:
+        name: The environment variable to read
+        default: The value used when the variable is unset, empty or invalid
+        
+    Returns:
+        The integer value of the variable, or the default
+    """
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+        
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid value for {name}: {value!r} is not an integer")
+        return default